@@ -1,4 +1,4 @@
-import re, datetime
+import re, datetime, time
 from datetime import timezone, timedelta
 
 # ---- helpers ----
@@ -66,6 +66,11 @@ def violates_clearance(job, blocklist) -> bool:
     text = safe_lower(f"{job.get('title','')} {job.get('description','')}")
     return any((term or "").lower() in text for term in (blocklist or []))
 
+# ---- internships ----
+_INTERN = re.compile(r"\bintern(ship)?\b|\bco-?op\b")
+def is_internship(title: str) -> bool:
+    return bool(_INTERN.search((title or "").lower()))
+
 # ---- domain gating ----
 _EXTRA_INCLUDE = [
     "data scientist","data analyst","data engineer","analytics engineer","bi analyst","bi developer",
@@ -91,16 +96,28 @@ _US_ABBR = ("AL","AK","AZ","AR","CO","CT","DE","FL","GA","HI","ID","IL","IN","IA
 _CA_PROV_ABBR = ("AB","BC","MB","NB","NL","NS","NT","NU","ON","PE","QC","SK","YT")
 _CA_PROV_NAMES = ("alberta","british columbia","manitoba","new brunswick","newfoundland","nova scotia","northwest territories","nunavut","ontario","prince edward island","quebec","saskatchewan","yukon")
 
-def is_us_job(job) -> bool:
-    blob = " ".join([job.get("location") or "", job.get("title") or "", job.get("description") or ""])
-    t = safe_lower(blob)
-    if "canada" in t or "canadian" in t: return False
+def _canada_blob(t: str) -> bool:
+    if "canada" in t or "canadian" in t: return True
     for n in _CA_PROV_NAMES:
-        if n in t: return False
-    if re.search(r"(,|\s|-)\s*(AB|BC|MB|NB|NL|NS|NT|NU|ON|PE|QC|SK|YT)(?:\b|,)", t, re.I): return False
-    if re.search(r"\b[A-Z]{2}\b\s*,\s*ca\b", t, re.I): return False
-    if re.search(r",\s*ca\b", t) and ("ontario" in t or "quebec" in t or "british columbia" in t): return False
-    if re.search(r"\b(remote\s*[-–]\s*canada|canada\s*\(remote\)|canada[- ]only)\b", t): return False
+        if n in t: return True
+    if re.search(r"(,|\s|-)\s*(AB|BC|MB|NB|NL|NS|NT|NU|ON|PE|QC|SK|YT)(?:\b|,)", t, re.I): return True
+    if re.search(r"\b[A-Z]{2}\b\s*,\s*ca\b", t, re.I): return True
+    if re.search(r",\s*ca\b", t) and ("ontario" in t or "quebec" in t or "british columbia" in t): return True
+    if re.search(r"\b(remote\s*[-–]\s*canada|canada\s*\(remote\)|canada[- ]only)\b", t): return True
+    return False
+
+def _job_blob(job) -> str:
+    blob = " ".join([job.get("location") or "", job.get("title") or "", job.get("description") or ""])
+    return safe_lower(blob)
+
+# Canada signals only ever add up as text is appended, so a job with no
+# description that already reads as Canadian stays rejected once it has one.
+def is_canadian(job) -> bool:
+    return _canada_blob(_job_blob(job))
+
+def is_us_job(job) -> bool:
+    t = _job_blob(job)
+    if _canada_blob(t): return False
     if re.search(r"\b(united states|u\.s\.a\.|u\.s\.|usa|us[- ]only|us[- ]based)\b", t): return True
     if re.search(r"\b(remote\s*[-–]\s*us|us\s*remote)\b", t): return True
     for n in _US_STATE_NAMES:
@@ -160,3 +177,42 @@ def meets_experience_max(job, max_years=3) -> bool:
     ys = _extract_years_all(text)
     if not ys: return True
     return max(ys) < int(max_years)
+
+# ---- predicate chain ----
+# Every predicate must pass, so the order they run in never changes the
+# result; it only decides how much work a rejected job costs. Order is
+# re-ranked as the run goes by average cost over observed rejection rate.
+def _chain_rank(st) -> float:
+    evaluated, rejected, seconds = st
+    return (seconds / max(evaluated, 1)) / ((rejected + 1) / (evaluated + 2))
+
+def run_filter_chain(jobs, predicates, skip=None, reorder_every=50):
+    """Keep jobs passing every (name, fn) predicate; returns (kept, stats).
+
+    `skip(job)` may name predicates the job is already known to pass; they
+    are neither run nor counted. stats maps name -> [evaluated, rejected,
+    seconds].
+    """
+    stats = {name: [0, 0, 0.0] for name, _ in predicates}
+    order = list(predicates)
+    kept = []
+    for n, job in enumerate(jobs, 1):
+        passed = skip(job) if skip else ()
+        for name, fn in order:
+            if name in passed: continue
+            st = stats[name]
+            t0 = time.perf_counter()
+            ok = fn(job)
+            st[2] += time.perf_counter() - t0
+            st[0] += 1
+            if not ok:
+                st[1] += 1; break
+        else:
+            kept.append(job)
+        if n % reorder_every == 0:
+            # Predicates never reached yet have no cost estimate; they keep
+            # their slot and only measured ones are re-ranked around them.
+            slots = [i for i, (name, _) in enumerate(order) if stats[name][0]]
+            ranked = sorted((order[i] for i in slots), key=lambda p: _chain_rank(stats[p[0]]))
+            for i, p in zip(slots, ranked): order[i] = p
+    return kept, stats
@@ -1,4 +1,4 @@
-import os, csv, yaml, sqlite3, datetime, io, time, random, re
+import os, csv, yaml, sqlite3, datetime, io, time, random
 from datetime import timezone
 from dotenv import load_dotenv
 from slack_sdk import WebClient
@@ -8,7 +8,8 @@ from sources import fetch_all
 from filters import (
     is_datasci, violates_clearance, meets_experience_max,
     is_within_days, sponsorship_score, is_us_job,
-    title_includes_required, title_level_is_ok, parse_when
+    title_includes_required, title_level_is_ok, parse_when,
+    is_internship, is_canadian, run_filter_chain
 )
 from taxonomy import categorize
 from utils import normalize_url
@@ -139,26 +140,44 @@ def main():
 
     init()
 
+    # Each filter is declared once: (name, reads description?, predicate).
+    # Order is only the starting point; run_filter_chain re-ranks it.
+    predicates = [
+        ("recency",     False, lambda j: is_within_days(j.get("posted_at"), days=RECENCY_DAYS)),
+        ("datasci",     True,  lambda j: is_datasci(j, include_kw, exclude_kw)),
+        ("title_must",  False, lambda j: not title_must or title_includes_required(j.get("title"), title_must)),
+        ("title_level", False, lambda j: title_level_is_ok(j.get("title"), title_block)),
+        ("clearance",   True,  lambda j: not violates_clearance(j, clr_block)),
+        ("experience",  True,  lambda j: meets_experience_max(j, max_years=max_years)),
+        ("internship",  False, lambda j: ALLOW_INTERNSHIPS or not is_internship(j.get("title"))),
+        ("not_canada",  False, lambda j: not enforce_us or not is_canadian({"location": j.get("location"), "title": j.get("title")})),
+        ("us_only",     True,  lambda j: not enforce_us or is_us_job(j)),
+    ]
+
+    # Boards that support it run the description-free filters before decoding
+    # descriptions, and skip decoding for postings these reject.
+    pre = [(name, fn) for name, reads_desc, fn in predicates if not reads_desc]
+    def gate(j): return all(fn(j) for _, fn in pre)
+
     print("Fetching…")
-    raw = fetch_all(cfg) or []
+    raw = fetch_all(cfg, gate=gate) or []
     print(f"Fetched {len(raw)} jobs")
 
-    filtered = []
+    candidates = []
     for j in raw:
         if not j.get("id") or not j.get("url") or not j.get("title"):
             continue
         j["url"] = normalize_url(j["url"])
-        if not is_within_days(j.get("posted_at"), days=RECENCY_DAYS):  continue
-        if not is_datasci(j, include_kw, exclude_kw):                 continue
-        if title_must and not title_includes_required(j.get("title"), title_must):  continue
-        if not title_level_is_ok(j.get("title"), title_block):        continue
-        if violates_clearance(j, clr_block):                          continue
-        if not meets_experience_max(j, max_years=max_years):          continue
-        if not ALLOW_INTERNSHIPS:
-            tl = (j.get("title") or "").lower()
-            if re.search(r"\bintern(ship)?\b|\bco-?op\b", tl):        continue
-        if enforce_us and not is_us_job(j):                           continue
-        filtered.append(j)
+        candidates.append(j)
+
+    # fetch_all only gates Greenhouse; re-running those predicates there could
+    # never reject and would skew their measured selectivity.
+    gated = {name for name, _ in pre}
+    filtered, stats = run_filter_chain(candidates, [(name, fn) for name, _, fn in predicates],
+                                       skip=lambda j: gated if j.get("source") == "Greenhouse" else ())
+    print(f"Filters kept {len(filtered)}/{len(candidates)}")
+    for name, (evaluated, rejected, seconds) in sorted(stats.items(), key=lambda kv: -kv[1][2]):
+        print(f"  {name:<12} rejected {rejected:>5}/{evaluated:<5} {seconds*1000:8.1f} ms")
 
     # Rank newest first + tiny sponsorship boost
     def posted_ts(job):
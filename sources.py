@@ -1,6 +1,6 @@
-import os, requests, feedparser
+import os, re, json, codecs, requests, feedparser
 from datetime import datetime, timezone
-from typing import List, Dict
+from typing import List, Dict, Iterator, Iterable, Callable, Optional
 from utils import normalize_url
 
 UA = {"User-Agent": "ds-job-bot/1.0 (+github actions)"}
@@ -31,27 +31,121 @@ def _iso_utc(ts: float) -> str:
     try: return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
     except: return datetime.now(timezone.utc).isoformat()
 
+# ---- Streaming JSON ----
+_JSON_STRUCT = re.compile(r'[\[\]{}"]')
+_JSON_KEY_SEP = re.compile(r'\s*:\s*')
+
+def _json_string_end(s: str, i: int) -> int:
+    """Index just past the string whose opening quote is at s[i], or -1 if cut off."""
+    while True:
+        i = s.find('"', i + 1)
+        if i < 0: return -1
+        k = i
+        while s[k - 1] == "\\": k -= 1
+        if (i - k) % 2 == 0: return i + 1
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[str]:
+    """Yield the raw text of each object in the top-level `key` array.
+
+    Only the object currently being read is buffered, so a multi-MB board
+    never sits in memory (or in Python strings) all at once. Raises
+    ValueError if the stream ends before the array is closed.
+    """
+    dec = codecs.getincrementaldecoder("utf-8")()
+    want = json.dumps(key)
+    buf, pos, depth, start, last, inside = "", 0, 0, None, None, False
+    for chunk in chunks:
+        buf += dec.decode(chunk)
+        while True:
+            m = _JSON_STRUCT.search(buf, pos)
+            if not m: pos = len(buf); break
+            i = m.start(); c = buf[i]
+            if c == '"':
+                end = _json_string_end(buf, i)
+                if end < 0: pos = i; break
+                if depth == 1: last = buf[i:end]
+                pos = end; continue
+            pos = i + 1
+            if c in "[{":
+                if inside and depth == 2 and c == "{": start = i
+                elif depth == 1 and c == "[" and last == want: inside = True
+                depth += 1
+            else:
+                depth -= 1
+                if inside and depth == 2 and start is not None:
+                    yield buf[start:pos]; start = None
+                elif inside and depth == 1:
+                    return
+        cut = pos if start is None else start
+        buf, pos = buf[cut:], pos - cut
+        if start is not None: start = 0
+    raise ValueError(f"stream ended before the {key!r} array closed")
+
+def project_json_object(raw: str, lazy: str):
+    """Parse one JSON object, leaving the top-level `lazy` string undecoded.
+
+    Returns (dict, literal); `json.loads(literal)` yields the skipped value.
+    """
+    want = json.dumps(lazy)
+    depth, pos = 0, 0
+    while True:
+        m = _JSON_STRUCT.search(raw, pos)
+        if not m: break
+        i = m.start(); pos = i + 1
+        if raw[i] != '"':
+            depth += 1 if raw[i] in "[{" else -1
+            continue
+        pos = _json_string_end(raw, i)
+        if pos < 0: break
+        if depth != 1 or raw[i:pos] != want: continue
+        sep = _JSON_KEY_SEP.match(raw, pos)
+        if not sep: continue
+        j = sep.end()
+        if raw[j:j + 1] != '"': break
+        end = _json_string_end(raw, j)
+        if end < 0: break
+        return json.loads(raw[:j] + '""' + raw[end:]), raw[j:end]
+    return json.loads(raw), '""'
+
 # ---- Greenhouse ----
-def fetch_greenhouse_company(slug: str) -> List[Dict]:
+def fetch_greenhouse_company(slug: str, gate: Optional[Callable[[Dict], bool]] = None) -> List[Dict]:
+    """Stream a `?content=true` board, decoding `content` only when needed.
+
+    `gate(job)` sees each posting without its description; postings it rejects
+    are dropped without decoding.
+    """
     url = f"https://boards-api.greenhouse.io/v1/boards/{slug}/jobs?content=true"
     out=[]
-    try:
-        r = requests.get(url, headers=UA, timeout=25); r.raise_for_status()
-        for j in (r.json().get("jobs") or []):
+    postings = _greenhouse_postings(slug, url)
+    while True:
+        # Reading and projecting postings is guarded: a board that fails, is
+        # cut short or holds a malformed posting is dropped whole, while
+        # gate errors propagate to the caller.
+        try: job, content = next(postings)
+        except StopIteration: break
+        except Exception: return []
+        if gate and not gate(job): continue
+        try: job["description"] = json.loads(content) or ""
+        except ValueError: return []
+        out.append(job)
+    return out
+
+def _greenhouse_postings(slug: str, url: str) -> Iterator[tuple]:
+    """Yield (job without description, raw content literal) per posting."""
+    with requests.get(url, headers=UA, timeout=25, stream=True) as r:
+        r.raise_for_status()
+        for raw in iter_json_array(r.iter_content(chunk_size=1 << 16), "jobs"):
+            j, content = project_json_object(raw, "content")
             jid = j.get("id")
             url2 = j.get("absolute_url") or f"https://boards.greenhouse.io/{slug}/jobs/{jid}"
-            out.append({
+            yield {
                 "id": f"greenhouse:{slug}:{jid}",
                 "title": j.get("title"), "company": slug,
                 "location": (j.get("location") or {}).get("name"),
                 "url": normalize_url(url2),
                 "source": "Greenhouse",
                 "posted_at": j.get("updated_at") or j.get("created_at"),
-                "description": j.get("content") or "",
-            })
-    except Exception:
-        pass
-    return out
+            }, content
 
 # ---- Lever ----
 def fetch_lever_company(slug: str) -> List[Dict]:
@@ -294,13 +388,13 @@ def fetch_usajobs(cfg) -> List[Dict]:
     return out
 
 # ---- Master fetch ----
-def fetch_all(cfg) -> List[Dict]:
+def fetch_all(cfg, gate: Optional[Callable[[Dict], bool]] = None) -> List[Dict]:
     s = (cfg.get("sources") or {}) if isinstance(cfg.get("sources"), dict) else {}
     if not s or not any(s.get(k) for k in DEFAULT_SOURCES.keys()):
         s = DEFAULT_SOURCES
 
     out: List[Dict] = []
-    for slug in (s.get("greenhouse_companies") or []): out.extend(fetch_greenhouse_company(slug))
+    for slug in (s.get("greenhouse_companies") or []): out.extend(fetch_greenhouse_company(slug, gate))
     for slug in (s.get("lever_companies") or []):      out.extend(fetch_lever_company(slug))
     for sub  in (s.get("ashby_subdomains") or []):     out.extend(fetch_ashby(sub))
     for c    in (s.get("smartrecruiters_companies") or []): out.extend(fetch_smartrecruiters(c))